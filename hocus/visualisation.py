@@ -1,3 +1,4 @@
+import sys
 from math import pi, cos, sin, sqrt
 
 import cairocffi as cairo
@@ -12,6 +13,13 @@ HEIGHT, WIDTH = 11.7 * 72, 2 * 8.3 * 72
 
 mm = 72 / 25.4  # dpi / (number of millimeters in one inch)
 
+# colours of visible sides of links (reached and unreached by the solver)
+COLORED = (1, 1, 0.7)
+UNCOLORED = (0.8, 0.2, 1)
+
+# length of a link in pixels from which preview draws lines instead of pixels
+PREVIEW_LINE_MIN_LINK = 6
+
 
 class Point:
     def __init__(self, x, y):
@@ -219,14 +227,9 @@ def visualise(graph, filename="data/result.pdf", show_positions=False):
                 q = transform(Point(*n.location))
                 cr.draw_link(p, q)
 
-                coloring = node.coloring.get(d, [])[:2]
-                if not coloring:
+                colors = link_colors(node, d)
+                if not colors:
                     continue
-                if d != Direction.DOWNRIGHT:
-                    coloring = list(reversed(coloring))
-                colors = [
-                    (1, 1, 0.7) if c else (0.8, 0.2, 1) for c in coloring
-                ]
 
                 # point in the 2D projection of the current cube nearest to the
                 # neighbouring cube
@@ -298,3 +301,117 @@ def visualise(graph, filename="data/result.pdf", show_positions=False):
     cr.stop_procrastinating()
     cr.show_page()
     print('Saved result to', filename)
+
+
+def link_colors(node, d):
+    """Colours of the two visible sides of the link from node in direction d
+
+    Ordered the same way as the filled quads in visualise: the first one lies
+    to the right of the link (when looking from node), the second one to the
+    left. Empty list if the graph has not been solved.
+    """
+    coloring = node.coloring.get(d, [])[:2]
+    if d != Direction.DOWNRIGHT:
+        coloring = list(reversed(coloring))
+    return [COLORED if c else UNCOLORED for c in coloring]
+
+
+def preview(graph, filename="data/preview.png", width=800):
+    """Quickly render a low-detail PNG of the graph
+
+    The representation is picked from the target resolution: if links are
+    at least PREVIEW_LINE_MIN_LINK pixels long, each visible side of a link
+    is drawn as one coloured line segment, otherwise every link is a single
+    coloured pixel written straight into the image buffer. Use visualise for
+    the full-detail picture.
+
+    Args:
+        graph: hocus.graph
+        filename: str -- where to save the PNG
+        width: int -- width of the image in pixels, height follows from the
+            aspect ratio of the map
+    """
+    locations = [node.location for node in graph.nodes]
+    min_x = min(x for x, y in locations)
+    min_y = min(y for x, y in locations)
+    max_x = max(x for x, y in locations)
+    max_y = max(y for x, y in locations)
+
+    # same proportions as in visualise, one unit of location is `scale` pixels
+    # along a link (links are two units long)
+    field_width = cos(pi / 6)
+    field_height = sin(pi / 6)
+    margin = 2
+    scale = (width - 1) / ((max_x - min_x + 2 * margin) * field_width)
+    height = int((max_y - min_y + 2 * margin) * field_height * scale) + 1
+
+    def transform(p):
+        return Point(
+            (p.x - min_x + margin) * field_width * scale,
+            (p.y - min_y + margin) * field_height * scale
+        )
+
+    links = [
+        (node, d, n)
+        for node in graph.nodes
+        for d, n in enumerate(node.neighbors)
+        if d in [2, 3, 4] and n is not None
+    ]
+
+    if 2 * scale >= PREVIEW_LINE_MIN_LINK:
+        surface = cairo.ImageSurface(cairo.FORMAT_RGB24, width, height)
+        cr = cairo.Context(surface)
+        cr.set_source_rgb(1, 1, 1)
+        cr.paint()
+        cr.set_line_width(max(1, scale / 4))
+
+        for node, d, n in links:
+            p = transform(Point(*node.location))
+            q = transform(Point(*n.location))
+            colors = link_colors(node, d)
+            if not colors:
+                cr.set_source_rgb(0, 0, 0)
+                cr.move_to(*p)
+                cr.line_to(*q)
+                cr.stroke()
+                continue
+
+            # shift the sides apart, shorten them so that links do not merge
+            shift = (q - p) * (scale / 4 / p.dist(q))
+            for color, angle in zip(colors, [-pi / 2, pi / 2]):
+                r = shift.rotated(angle)
+                cr.set_source_rgb(*color)
+                cr.move_to(*(p + r + shift))
+                cr.line_to(*(q + r - shift))
+                cr.stroke()
+    else:
+        stride = cairo.ImageSurface.format_stride_for_width(
+            cairo.FORMAT_RGB24, width
+        )
+        data = bytearray(b'\xff' * stride * height)
+
+        def put_pixel(p, color):
+            # FORMAT_RGB24 pixels are native-endian 32-bit 0x00RRGGBB
+            offset = int(p.y) * stride + int(p.x) * 4
+            r, g, b = (int(c * 255) for c in color)
+            data[offset:offset + 4] = (
+                (r << 16 | g << 8 | b).to_bytes(4, sys.byteorder)
+            )
+
+        for node, d, n in links:
+            colors = link_colors(node, d)
+            if not colors:
+                color = (0, 0, 0)
+            elif COLORED in colors:
+                color = COLORED
+            else:
+                color = UNCOLORED
+            middle = Point(*node.location) + Point(*n.location)
+            put_pixel(transform(middle * 0.5), color)
+
+        surface = cairo.ImageSurface.create_for_data(
+            data, cairo.FORMAT_RGB24, width, height, stride
+        )
+
+    surface.write_to_png(filename)
+    print('Saved preview to', filename)